@@ -1,22 +1,54 @@
 # app/core/deps.py
+import asyncio
+import hashlib
+import time
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from typing import Dict, Any
 from bson import ObjectId
+from cachetools import TTLCache
 
-from jose import JWTError, ExpiredSignatureError
+from jwt import ExpiredSignatureError, InvalidTokenError as JWTError
 
 from app.core.security import decode_access_token
-from app.db.mongo import get_master_db
+from app.db.mongo import get_admins_collection
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/admin/login")
 
+# short-lived cache of decoded token -> (payload, admin_doc); skips the JWT
+# decode and both Mongo lookups for repeat requests within the TTL window.
+# Keys are hashes so raw tokens are never held in memory.
+_TOKEN_CACHE: TTLCache = TTLCache(maxsize=10000, ttl=60)
+_TOKEN_CACHE_LOCK = asyncio.Lock()
+
+
+def _token_cache_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+async def invalidate_token_cache(token: str) -> None:
+    """Drop a cached token entry, e.g. after deactivating the admin."""
+    async with _TOKEN_CACHE_LOCK:
+        _TOKEN_CACHE.pop(_token_cache_key(token), None)
+
 
 async def get_current_admin(token: str = Depends(oauth2_scheme)) -> Dict[str, Any]:
     """
     Decode token and fetch admin from DB. Raises HTTPException 401 on invalid/expired token.
     Returns admin document (dict) and adds 'org' (organization doc) under the key 'org_doc' optionally.
     """
+    cache_key = _token_cache_key(token)
+    async with _TOKEN_CACHE_LOCK:
+        cached = _TOKEN_CACHE.get(cache_key)
+    if cached is not None:
+        payload, admin_doc = cached
+        # expiry must still be honoured even while the cache entry lives
+        if payload.get("exp", 0) > time.time():
+            return dict(admin_doc)
+        async with _TOKEN_CACHE_LOCK:
+            _TOKEN_CACHE.pop(cache_key, None)
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token expired")
+
     try:
         payload = decode_access_token(token)
     except ExpiredSignatureError:
@@ -25,27 +57,38 @@ async def get_current_admin(token: str = Depends(oauth2_scheme)) -> Dict[str, An
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
 
     admin_id = payload.get("sub")
-    org_id = payload.get("org")
 
-    if not admin_id:
+    if not admin_id or not ObjectId.is_valid(admin_id):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token payload")
 
-    db = get_master_db()
+    # fetch admin and its organization in one round trip instead of two
+    admins = get_admins_collection()
     try:
-        admin_doc = await db["admin_users"].find_one({"_id": ObjectId(admin_id), "is_active": True})
+        pipeline = [
+            {"$match": {"_id": ObjectId(admin_id), "is_active": True}},
+            {"$limit": 1},
+            {
+                "$lookup": {
+                    "from": "organizations",
+                    "localField": "org_id",
+                    "foreignField": "_id",
+                    "as": "org_doc",
+                }
+            },
+            {"$unwind": {"path": "$org_doc", "preserveNullAndEmptyArrays": True}},
+            # only the fields callers actually read; keeps password_hash off the wire
+            {"$project": {"_id": 1, "org_id": 1, "role": 1, "is_active": 1, "email": 1, "org_doc": 1}},
+        ]
+        docs = await admins.aggregate(pipeline).to_list(1)
+        admin_doc = docs[0] if docs else None
     except Exception:
         admin_doc = None
 
     if not admin_doc:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Admin not found or inactive")
 
-    org_doc = None
-    if org_id:
-        try:
-            org_doc = await db["organizations"].find_one({"_id": ObjectId(org_id)})
-        except Exception:
-            org_doc = None
+    admin_doc.setdefault("org_doc", None)
 
-    # attach org_doc if useful
-    admin_doc["org_doc"] = org_doc
-    return admin_doc
+    async with _TOKEN_CACHE_LOCK:
+        _TOKEN_CACHE[cache_key] = (payload, admin_doc)
+    return dict(admin_doc)
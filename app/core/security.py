@@ -1,47 +1,124 @@
 # app/core/security.py
-from datetime import datetime, timedelta
+import asyncio
+import base64
+import concurrent.futures
+import hashlib
+import hmac
+import os
+import time
+from datetime import timedelta
 from typing import Optional, Dict, Any
 
-from jose import jwt
+import jwt
+import orjson
+from fastapi import HTTPException, status
 from passlib.context import CryptContext
 
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# argon2id (native SIMD-capable implementation) is the primary scheme; bcrypt
+# stays listed so existing hashes still verify, but is marked deprecated so
+# they are upgraded transparently on login via password_needs_update.
+# BCRYPT_ROUNDS still governs any legacy bcrypt hashing.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated=["bcrypt"],
+    argon2__memory_cost=65536,
+    argon2__time_cost=2,
+    argon2__parallelism=2,
+    bcrypt__rounds=settings.BCRYPT_ROUNDS,
+)
 ALGORITHM = settings.JWT_ALGORITHM
 SECRET_KEY = settings.JWT_SECRET
 ACCESS_TOKEN_EXPIRE_MINUTES = settings.ACCESS_TOKEN_EXPIRE_MINUTES
+_EXP_SECS = ACCESS_TOKEN_EXPIRE_MINUTES * 60
 
+# the JOSE header is identical for every token this service issues, so its
+# base64 form is computed once; per token we only encode the payload and HMAC
+_HEADER_B64 = base64.urlsafe_b64encode(b'{"alg":"HS256","typ":"JWT"}').rstrip(b"=")
+_KEY = SECRET_KEY.encode()
 
-def hash_password(plain_password: str) -> str:
+# password hashing is pure CPU work (tens to hundreds of ms per call) and
+# would block the event loop, so it runs in a process pool; the semaphore
+# bounds queued work so a login flood degrades to 503s instead of unbounded
+# memory growth.
+_HASH_POOL = concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count())
+_HASH_SEMAPHORE = asyncio.Semaphore(500)
+
+
+def _hash_sync(plain_password: str) -> str:
+    # runs inside the pool workers; must stay module-level to be picklable
     return pwd_context.hash(plain_password)
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+def _verify_sync(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def _dummy_verify_sync() -> None:
+    pwd_context.dummy_verify()
+
+
+async def _run_hashing(func, *args):
+    if _HASH_SEMAPHORE.locked():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server busy, try again later",
+        )
+    async with _HASH_SEMAPHORE:
+        return await asyncio.get_running_loop().run_in_executor(_HASH_POOL, func, *args)
+
+
+async def hash_password(plain_password: str) -> str:
+    return await _run_hashing(_hash_sync, plain_password)
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return await _run_hashing(_verify_sync, plain_password, hashed_password)
+
+
+async def dummy_verify() -> None:
+    """
+    Burn the same CPU as a failed verify. Called when no admin (or no hash)
+    matches, so wall time doesn't reveal which emails exist.
+    """
+    await _run_hashing(_dummy_verify_sync)
+
+
+def password_needs_update(hashed_password: str) -> bool:
+    """True when the stored hash uses outdated parameters (e.g. old rounds)."""
+    return pwd_context.needs_update(hashed_password)
+
+
 def create_access_token(subject: str, org_id: str, expires_delta: Optional[timedelta] = None) -> str:
     """
     Create a JWT token with 'sub' (admin id) and 'org' (organization id) in payload.
     """
-    now = datetime.now()
-    if expires_delta is None:
-        expires_delta = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    expire = now + expires_delta
+    # epoch ints directly: iat/exp are unix timestamps anyway, so skip the
+    # datetime/timedelta object construction per token
+    now_ts = int(time.time())
+    exp_secs = int(expires_delta.total_seconds()) if expires_delta is not None else _EXP_SECS
     to_encode: Dict[str, Any] = {
         "sub": subject,
         "org": org_id,
-        "iat": int(now.timestamp()),
-        "exp": int(expire.timestamp()),
+        "iat": now_ts,
+        "exp": now_ts + exp_secs,
     }
-    token = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-    return token
+    if ALGORITHM == "HS256":
+        return _encode_hs256(to_encode)
+    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+
+
+def _encode_hs256(payload: Dict[str, Any]) -> str:
+    payload_b64 = base64.urlsafe_b64encode(orjson.dumps(payload)).rstrip(b"=")
+    signing = _HEADER_B64 + b"." + payload_b64
+    sig = base64.urlsafe_b64encode(hmac.new(_KEY, signing, hashlib.sha256).digest()).rstrip(b"=")
+    return (signing + b"." + sig).decode()
 
 
 def decode_access_token(token: str) -> Dict[str, Any]:
     """
-    Decode JWT and return payload. Raises jose.JWTError on invalid token.
+    Decode JWT and return payload. Raises jwt.InvalidTokenError on invalid token.
     """
     payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
     return payload
@@ -4,11 +4,27 @@ from motor.motor_asyncio import AsyncIOMotorClient
 from app.core.config import settings
 
 _client: Optional[AsyncIOMotorClient] = None
+_master_db = None
+_admins = None
+_orgs = None
 
 def init_client() -> None:
-    global _client
+    global _client, _master_db, _admins, _orgs
     if _client is None:
-        _client = AsyncIOMotorClient(settings.MONGO_URI)
+        # explicit pool bounds: minPoolSize keeps warm connections so the
+        # first requests after startup don't pay connection setup cost
+        _client = AsyncIOMotorClient(
+            settings.MONGO_URI,
+            maxPoolSize=settings.MONGO_MAX_POOL_SIZE,
+            minPoolSize=settings.MONGO_MIN_POOL_SIZE,
+            maxIdleTimeMS=settings.MONGO_MAX_IDLE_TIME_MS,
+            serverSelectionTimeoutMS=2000,
+        )
+        # memoize the hot handles; db[name] builds a fresh Collection wrapper
+        # on every lookup otherwise
+        _master_db = _client[settings.MASTER_DB]
+        _admins = _master_db["admin_users"]
+        _orgs = _master_db["organizations"]
 
 def get_client() -> AsyncIOMotorClient:
     if _client is None:
@@ -17,14 +33,28 @@ def get_client() -> AsyncIOMotorClient:
     return _client
 
 def close_client() -> None:
-    global _client
+    global _client, _master_db, _admins, _orgs
     if _client is not None:
         _client.close()
         _client = None
+        _master_db = None
+        _admins = None
+        _orgs = None
 
 def get_master_db():
-    client = get_client()
-    return client[settings.MASTER_DB]
+    if _master_db is None:
+        init_client()
+    return _master_db
+
+def get_admins_collection():
+    if _admins is None:
+        init_client()
+    return _admins
+
+def get_orgs_collection():
+    if _orgs is None:
+        init_client()
+    return _orgs
 
 def get_org_collection(collection_name: str):
     db = get_master_db()
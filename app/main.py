@@ -1,5 +1,6 @@
 # app/main.py
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 from app.db.mongo import init_client, get_client, close_client, get_master_db, get_org_collection
 from app.routes.auth import router as auth_router
@@ -15,12 +16,24 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print("Mongo ping failed:", e)
         # you can raise to stop app startup if you prefer
+    # indexes for the hot lookup paths; create_index is idempotent. The unique
+    # name index is the only thing enforcing org-name uniqueness (there is no
+    # application-level pre-check anymore), so if it can't be created the app
+    # must not serve traffic and silently admit duplicates.
+    try:
+        db = get_master_db()
+        await db["admin_users"].create_index([("email", 1), ("is_active", 1)])
+        await db["admin_users"].create_index([("org_id", 1), ("email", 1)], unique=True)
+        await db["organizations"].create_index("name", unique=True)
+    except Exception as e:
+        print("Index creation failed:", e)
+        raise
     yield
     # shutdown: close client
     close_client()
     print("MongoDB connection closed")
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # include routers etc.
 @app.get("/help")
@@ -1,8 +1,9 @@
 # app/routes/auth.py
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, EmailStr
 
-from app.services.auth_service import AuthService
+from app.services.auth_service import AuthService, get_auth_service
 
 router = APIRouter(prefix="/admin", tags=["auth"])
 
@@ -12,14 +13,8 @@ class AdminLoginIn(BaseModel):
     password: str
 
 
-class TokenOut(BaseModel):
-    access_token: str
-    token_type: str = "bearer"
-
-
-@router.post("/login", response_model=TokenOut)
-async def admin_login(payload: AdminLoginIn):
-    auth = AuthService()
+@router.post("/login")
+async def admin_login(payload: AdminLoginIn, auth: AuthService = Depends(get_auth_service)):
     result = await auth.authenticate_admin(payload.email, payload.password)
     if not result:
         # do not reveal whether email exists
@@ -28,4 +23,4 @@ async def admin_login(payload: AdminLoginIn):
     admin_doc = result["admin"]
     token = await auth.create_token_for_admin(admin_doc)
 
-    return {"access_token": token, "token_type": "bearer"}
+    return ORJSONResponse({"access_token": token, "token_type": "bearer"})
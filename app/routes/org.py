@@ -1,9 +1,10 @@
 # app/routes/org.py
-from fastapi import APIRouter, Body, HTTPException, Query, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
 from fastapi import Header
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, EmailStr, Field
 
-from app.services.org_service import OrganizationService
+from app.services.org_service import OrganizationService, get_org_service
 
 router = APIRouter(prefix="/org", tags=["org"])
 
@@ -14,15 +15,6 @@ class OrgCreateIn(BaseModel):
     password: str
 
 
-class OrgCreateOut(BaseModel):
-    organization: dict
-    admin: dict
-
-
-class OrgGetOut(BaseModel):
-    organization: dict
-
-
 class OrgUpdateIn(BaseModel):
     organization_name: str = Field(..., description="New name for the organization")
     email: EmailStr
@@ -36,18 +28,12 @@ class OrgUpdateBetterIn(BaseModel):
     password: str
 
 
-class OrgDeleteOut(BaseModel):
-    deleted: bool
-    organization_name: str
-
-
 class OrgDeleteIn(BaseModel):
     organization_name: str = Field(..., description="Name of the organization to delete")
 
 
-@router.post("/create", response_model=OrgCreateOut)
-async def create_org(payload: OrgCreateIn):
-    service = OrganizationService()
+@router.post("/create")
+async def create_org(payload: OrgCreateIn, service: OrganizationService = Depends(get_org_service)):
     try:
         result = await service.create_organization(
             organization_name=payload.organization_name,
@@ -60,22 +46,23 @@ async def create_org(payload: OrgCreateIn):
     if not result or not result.get("organization"):
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to create organization")
 
-    return result
+    return ORJSONResponse(result)
 
 
-@router.get("/get", response_model=OrgGetOut)
-async def get_org(organization_name: str = Query(..., description="Name of the organization")):
-    service = OrganizationService()
+@router.get("/get")
+async def get_org(
+    organization_name: str = Query(..., description="Name of the organization"),
+    service: OrganizationService = Depends(get_org_service),
+):
     org = await service.get_organization_by_name(organization_name)
     if not org:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Organization not found")
 
-    return {"organization": org}
+    return ORJSONResponse({"organization": org})
 
 
-@router.put("/update", response_model=OrgGetOut)
-async def update_org(payload: OrgUpdateIn):
-    service = OrganizationService()
+@router.put("/update")
+async def update_org(payload: OrgUpdateIn, service: OrganizationService = Depends(get_org_service)):
     try:
         result = await service.update_organization(
             organization_name=payload.organization_name,
@@ -88,12 +75,11 @@ async def update_org(payload: OrgUpdateIn):
     if not result or not result.get("organization"):
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to update organization")
 
-    return result
+    return ORJSONResponse(result)
 
 
-@router.put("/update_better", response_model=OrgGetOut)
-async def update_org_better(payload: OrgUpdateBetterIn):
-    service = OrganizationService()
+@router.put("/update_better")
+async def update_org_better(payload: OrgUpdateBetterIn, service: OrganizationService = Depends(get_org_service)):
     try:
         result = await service.update_organization_better(
             current_name=payload.current_organization_name,
@@ -107,16 +93,16 @@ async def update_org_better(payload: OrgUpdateBetterIn):
     if not result or not result.get("organization"):
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to update organization")
 
-    return result
+    return ORJSONResponse(result)
 
 
-@router.delete("/delete", response_model=OrgDeleteOut)
+@router.delete("/delete")
 async def delete_org(
     organization_name: str | None = Query(None, description="Name of the organization to delete (optional if provided in body)"),
     authorization: str = Header(None, alias="Authorization"),
     payload: OrgDeleteIn | None = Body(None),
+    service: OrganizationService = Depends(get_org_service),
 ):
-    service = OrganizationService()
     org_name = payload.organization_name if payload and payload.organization_name else organization_name
     if not org_name:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="organization_name is required")
@@ -131,4 +117,4 @@ async def delete_org(
     if not result or not result.get("deleted"):
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to delete organization")
 
-    return result
+    return ORJSONResponse(result)
@@ -1,24 +1,39 @@
 # app/services/auth_service.py
+import asyncio
+from functools import lru_cache
 from typing import Optional, Dict, Any
 from bson import ObjectId
 
-from app.db.mongo import get_master_db
-from app.core.security import verify_password, create_access_token
+from app.db.mongo import get_admins_collection, get_master_db, get_orgs_collection
+from app.core.security import (
+    create_access_token,
+    dummy_verify,
+    hash_password,
+    password_needs_update,
+    verify_password,
+)
+
+# strong references to in-flight rehash tasks; the event loop only holds a
+# weak reference, so a bare create_task could be garbage-collected mid-run
+_REHASH_TASKS: set = set()
 
 
 class AuthService:
     def __init__(self):
         self.db = get_master_db()
-        # collections
-        self.admins = self.db["admin_users"]
-        self.organizations = self.db["organizations"]
+        # cached collection handles
+        self.admins = get_admins_collection()
+        self.organizations = get_orgs_collection()
 
     async def find_admin_by_email(self, email: str) -> Optional[Dict[str, Any]]:
         """
         Find an active admin by email across master admin_users collection.
         Note: admin email uniqueness is per-org in schema, but for login we search globally.
         """
-        doc = await self.admins.find_one({"email": email, "is_active": True})
+        doc = await self.admins.find_one(
+            {"email": email, "is_active": True},
+            projection={"_id": 1, "org_id": 1, "password_hash": 1, "password": 1},
+        )
         return doc
 
     async def authenticate_admin(self, email: str, password: str) -> Optional[Dict[str, Any]]:
@@ -26,25 +41,57 @@ class AuthService:
         Verify credentials. If success, return admin doc with org metadata (org_id and collection_name).
         """
         admin = await self.find_admin_by_email(email)
-        if not admin:
+        hashed = (admin or {}).get("password_hash") or (admin or {}).get("password")
+        if not admin or not hashed:
+            # equalize timing with the successful-lookup branch so login
+            # latency doesn't reveal whether the email exists
+            await dummy_verify()
             return None
 
-        hashed = admin.get("password_hash") or admin.get("password")  # compatibility if different field
-        if not hashed:
-            return None
+        # the bcrypt verify (CPU, in the pool) and the org fetch (network) are
+        # independent, so overlap them instead of awaiting sequentially
+        # org_id comes back from Mongo as an ObjectId already; only parse
+        # when a legacy doc stored it as a string
+        org_id = admin.get("org_id")
+        if org_id is not None and not isinstance(org_id, ObjectId):
+            org_id = ObjectId(org_id)
+
+        verify_task = verify_password(password, hashed)
+        if org_id:
+            ok, org = await asyncio.gather(
+                verify_task,
+                self.organizations.find_one(
+                    {"_id": org_id},
+                    projection={"_id": 1, "name": 1, "collection_name": 1},
+                ),
+            )
+        else:
+            ok = await verify_task
+            org = None
 
-        if not verify_password(password, hashed):
+        if not ok:
             return None
 
-        # fetch organization metadata for token (optional safety)
-        org_id = admin.get("org_id")
-        org = await self.organizations.find_one({"_id": ObjectId(org_id)}) if org_id else None
+        # transparently upgrade hashes created with older (slower) parameters;
+        # done in the background so login latency is unaffected
+        if password_needs_update(hashed):
+            task = asyncio.create_task(self._rehash_password(admin["_id"], password))
+            _REHASH_TASKS.add(task)
+            task.add_done_callback(_REHASH_TASKS.discard)
 
         return {
             "admin": admin,
             "org": org,
         }
 
+    async def _rehash_password(self, admin_id: Any, password: str) -> None:
+        try:
+            new_hash = await hash_password(password)
+            await self.admins.update_one({"_id": admin_id}, {"$set": {"password_hash": new_hash}})
+        except Exception:
+            # best-effort upgrade; the old hash keeps working
+            pass
+
     async def create_token_for_admin(self, admin_doc: Dict[str, Any]) -> str:
         """
         Given a verified admin_doc, create a JWT token containing admin_id and org_id.
@@ -53,3 +100,9 @@ class AuthService:
         org_id = str(admin_doc["org_id"]) if admin_doc.get("org_id") else ""
         token = create_access_token(subject=admin_id, org_id=org_id)
         return token
+
+
+@lru_cache(maxsize=1)
+def get_auth_service() -> AuthService:
+    """Process-wide AuthService; the service is stateless aside from DB handles."""
+    return AuthService()
@@ -1,15 +1,58 @@
 # app/services/org_service.py
+import asyncio
 import re
-from datetime import datetime
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 from bson import ObjectId
-from pymongo.errors import CollectionInvalid
+from cachetools import TTLCache
+from pymongo.errors import CollectionInvalid, DuplicateKeyError, OperationFailure
 
-from app.core.security import hash_password, verify_password, decode_access_token
-from app.db.mongo import get_master_db
+from app.core.deps import invalidate_token_cache
+from app.core.security import decode_access_token, dummy_verify, hash_password, verify_password
+from app.db.mongo import get_admins_collection, get_master_db, get_orgs_collection
 from app.models.utils import serialize_mongo_doc
 
+_BEARER_RE = re.compile(r"^\s*bearer\s+", re.IGNORECASE)
+
+
+class _SlugTable(dict):
+    # str.translate consults this per code point; __missing__ maps anything
+    # outside [a-z0-9] to "_", covering the full unicode range
+    def __missing__(self, codepoint: int) -> str:
+        return "_"
+
+
+_SLUG_TABLE = _SlugTable({ord(c): c for c in "abcdefghijklmnopqrstuvwxyz0123456789"})
+
+# repeated calls with the same token skip the HMAC verification; entries can
+# outlive the token, so callers must re-check exp from the cached payload
+_decode_token_cached = lru_cache(maxsize=4096)(decode_access_token)
+
+# serialized org responses keyed by normalized name; the 5s TTL absorbs read
+# bursts while staying short enough that renames/deletes (which also evict
+# explicitly) are never visibly stale
+_ORG_CACHE: TTLCache = TTLCache(maxsize=2048, ttl=5)
+_ORG_CACHE_LOCK = asyncio.Lock()
+
+
+async def _org_cache_pop(*names: str) -> None:
+    async with _ORG_CACHE_LOCK:
+        for name in names:
+            _ORG_CACHE.pop(name, None)
+
+
+@lru_cache(maxsize=1024)
+def _normalize_name_cached(name: str) -> str:
+    # request flows often normalize the same name several times (e.g. update
+    # then the response fetch); bounded so adversarial input can't grow it.
+    # translate + split/join are tight C loops — faster than the regex engine
+    # on the short strings seen here
+    slug = name.strip().lower().translate(_SLUG_TABLE)
+    return "_".join(filter(None, slug.split("_")))
+
 
 class OrganizationService:
     """
@@ -19,15 +62,126 @@ class OrganizationService:
 
     def __init__(self) -> None:
         self.db = get_master_db()
-        self.organizations = self.db["organizations"]
-        self.admins = self.db["admin_users"]
+        self.organizations = get_orgs_collection()
+        self.admins = get_admins_collection()
 
     @staticmethod
     def _normalize_name(name: str) -> str:
         """Turn organization name into a slug usable in collection names."""
-        slug = name.strip().lower()
-        slug = re.sub(r"[^a-z0-9]+", "_", slug).strip("_")
-        return slug
+        return _normalize_name_cached(name)
+
+    async def _authenticate_admin_with_org(
+        self, email: str, password: str, org_lookup: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Authenticate an admin by email/password while joining an organization
+        via the given $lookup spec, all in one aggregation round trip.
+        Raises ValueError("Invalid credentials") on failure; the joined org
+        list is left under the "org" key of the returned admin doc.
+        """
+        pipeline = [
+            {"$match": {"email": email, "is_active": True}},
+            {"$limit": 1},
+            {"$lookup": org_lookup},
+            {
+                "$project": {
+                    "password_hash": 1,
+                    "password": 1,
+                    "org_id": 1,
+                    "is_active": 1,
+                    "email": 1,
+                    "org": 1,
+                }
+            },
+        ]
+        docs = await self.admins.aggregate(pipeline).to_list(1)
+        admin = docs[0] if docs else None
+        hashed = (admin or {}).get("password_hash") or (admin or {}).get("password")
+        if hashed:
+            ok = await verify_password(password, hashed)
+        else:
+            # unknown email (or hashless doc): burn the same CPU as a real
+            # verify so response time doesn't reveal which emails exist
+            await dummy_verify()
+            ok = False
+        if not admin or not ok:
+            raise ValueError("Invalid credentials")
+        return admin
+
+    async def _perform_rename(
+        self, org: Dict[str, Any], normalized_new: str, display_name: str, now: datetime, admin: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Rename an org's collection and update its metadata, returning the
+        serialized organization view. Shared by both update paths so future
+        changes land in one place.
+        """
+        old_collection = org.get("collection_name")
+        if not old_collection:
+            raise ValueError("Organization collection missing")
+        new_collection = f"org_{normalized_new}"
+
+        # atomic server-side rename: O(1) metadata change regardless of
+        # collection size, and no rollback window to worry about
+        try:
+            await self.db.client.admin.command(
+                "renameCollection",
+                f"{self.db.name}.{old_collection}",
+                to=f"{self.db.name}.{new_collection}",
+                dropTarget=False,
+            )
+        except OperationFailure as exc:
+            if exc.code == 48:  # NamespaceExists
+                # the target collection name derives from the new org name, so
+                # a namespace clash means another org already holds that name
+                raise ValueError("Organization name already exists")
+            if exc.code == 26:  # NamespaceNotFound
+                raise ValueError("Organization collection missing")
+            raise
+
+        # update organization metadata; the unique name index makes the
+        # duplicate check atomic instead of a racy pre-flight find_one
+        try:
+            await self.organizations.update_one(
+                {"_id": org["_id"]},
+                {
+                    "$set": {
+                        "name": normalized_new,
+                        "display_name": display_name,
+                        "collection_name": new_collection,
+                        "updated_at": now,
+                    }
+                },
+            )
+        except DuplicateKeyError:
+            # another org holds the name; undo the collection rename
+            await self.db.client.admin.command(
+                "renameCollection",
+                f"{self.db.name}.{new_collection}",
+                to=f"{self.db.name}.{old_collection}",
+                dropTarget=False,
+            )
+            raise ValueError("Organization name already exists")
+
+        await _org_cache_pop(org.get("name"), normalized_new)
+
+        # everything needed for the response is already in memory, so skip
+        # the two read round trips get_organization_by_name would cost
+        if org.get("owner_admin_id") == admin.get("_id"):
+            return serialize_mongo_doc(
+                {
+                    "name": normalized_new,
+                    "display_name": display_name,
+                    "collection_name": f"org_{normalized_new}",
+                    "status": org.get("status"),
+                    "created_at": org.get("created_at"),
+                    "updated_at": now,
+                    "owner_email": admin.get("email"),
+                }
+            )
+        # renamed by a non-owner admin: resolve the owner's email via the
+        # regular read path
+        return await self.get_organization_by_name(normalized_new)
 
     async def get_organization_by_name(self, organization_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -38,24 +192,38 @@ class OrganizationService:
         if not normalized:
             return None
 
-        org = await self.organizations.find_one({"name": normalized})
-        if not org:
-            return None
-
-        owner_email: Optional[str] = None
-        owner_admin_id = org.get("owner_admin_id")
-        if owner_admin_id:
-            admin = await self.admins.find_one({"_id": owner_admin_id})
-            if admin:
-                owner_email = admin.get("email")
+        async with _ORG_CACHE_LOCK:
+            cached = _ORG_CACHE.get(normalized)
+        if cached is not None:
+            return dict(cached)
 
-        # hide internal identifiers and expose owner email instead
-        org = dict(org)
-        org.pop("_id", None)
-        org.pop("owner_admin_id", None)
-        org["owner_email"] = owner_email
+        # join the owner admin's email server-side so the read is a single
+        # round trip; the $project also hides the internal identifiers
+        pipeline = [
+            {"$match": {"name": normalized}},
+            {"$limit": 1},
+            {
+                "$lookup": {
+                    "from": "admin_users",
+                    "localField": "owner_admin_id",
+                    "foreignField": "_id",
+                    "as": "_owner",
+                    "pipeline": [{"$project": {"email": 1, "_id": 0}}],
+                }
+            },
+            {"$addFields": {"owner_email": {"$first": "$_owner.email"}}},
+            {"$project": {"_id": 0, "owner_admin_id": 0, "_owner": 0}},
+        ]
+        docs = await self.organizations.aggregate(pipeline).to_list(1)
+        if not docs:
+            return None
+        org = docs[0]
+        org.setdefault("owner_email", None)
 
-        return serialize_mongo_doc(org)
+        result = serialize_mongo_doc(org)
+        async with _ORG_CACHE_LOCK:
+            _ORG_CACHE[normalized] = result
+        return dict(result)
 
     async def update_organization(self, organization_name: str, email: str, password: str) -> Dict[str, Any]:
         """
@@ -66,73 +234,32 @@ class OrganizationService:
         if not normalized_new:
             raise ValueError("Organization name is empty after normalization")
 
-        # authenticate admin
-        admin = await self.admins.find_one({"email": email, "is_active": True})
-        if not admin:
-            raise ValueError("Invalid credentials")
-        hashed = admin.get("password_hash") or admin.get("password")
-        if not hashed or not verify_password(password, hashed):
-            raise ValueError("Invalid credentials")
+        admin = await self._authenticate_admin_with_org(
+            email,
+            password,
+            {
+                "from": "organizations",
+                "localField": "org_id",
+                "foreignField": "_id",
+                "as": "org",
+            },
+        )
 
-        # fetch current org
-        org_id = admin.get("org_id")
-        if not org_id:
+        if not admin.get("org_id"):
             raise ValueError("Admin is not linked to the organization")
-        org = await self.organizations.find_one({"_id": org_id})
+        orgs = admin.pop("org", None) or []
+        org = orgs[0] if orgs else None
         if not org:
             raise ValueError("Organization not found")
 
         # if name unchanged, just return current view
-        current_name = org.get("name")
-        if current_name == normalized_new:
+        if org.get("name") == normalized_new:
             existing = await self.get_organization_by_name(organization_name)
             return {"organization": existing}
 
-        # ensure new name does not clash
-        existing = await self.organizations.find_one({"name": normalized_new})
-        if existing:
-            raise ValueError("Organization name already exists")
-
-        old_collection = org.get("collection_name")
-        if not old_collection:
-            raise ValueError("Organization collection missing")
-        new_collection = f"org_{normalized_new}"
-        now = datetime.now()
-
-        # create new collection and migrate documents
-        try:
-            await self.db.create_collection(new_collection)
-        except CollectionInvalid:
-            raise ValueError("Organization collection already exists")
-
-        old_coll = self.db[old_collection]
-        new_coll = self.db[new_collection]
-        try:
-            docs = await old_coll.find({}).to_list(length=None)
-            if docs:
-                await new_coll.insert_many(docs)
-        except Exception:
-            # rollback newly created collection if migration fails
-            await new_coll.drop()
-            raise
-
-        # drop old collection after successful copy
-        await old_coll.drop()
-
-        # update organization metadata
-        await self.organizations.update_one(
-            {"_id": org_id},
-            {
-                "$set": {
-                    "name": normalized_new,
-                    "display_name": organization_name,
-                    "collection_name": new_collection,
-                    "updated_at": now,
-                }
-            },
+        updated = await self._perform_rename(
+            org, normalized_new, organization_name, datetime.now(timezone.utc), admin
         )
-
-        updated = await self.get_organization_by_name(organization_name)
         return {"organization": updated}
 
     async def update_organization_better(
@@ -152,16 +279,22 @@ class OrganizationService:
         if not normalized_new:
             raise ValueError("New organization name is empty after normalization")
 
-        # authenticate admin
-        admin = await self.admins.find_one({"email": email, "is_active": True})
-        if not admin:
-            raise ValueError("Invalid credentials")
-        hashed = admin.get("password_hash") or admin.get("password")
-        if not hashed or not verify_password(password, hashed):
-            raise ValueError("Invalid credentials")
+        admin = await self._authenticate_admin_with_org(
+            email,
+            password,
+            {
+                "from": "organizations",
+                "let": {"cn": normalized_current},
+                "pipeline": [
+                    {"$match": {"$expr": {"$eq": ["$name", "$$cn"]}}},
+                    {"$limit": 1},
+                ],
+                "as": "org",
+            },
+        )
 
-        # fetch current org by name
-        org = await self.organizations.find_one({"name": normalized_current})
+        orgs = admin.pop("org", None) or []
+        org = orgs[0] if orgs else None
         if not org:
             raise ValueError("Organization not found")
 
@@ -174,50 +307,9 @@ class OrganizationService:
             existing = await self.get_organization_by_name(current_name)
             return {"organization": existing}
 
-        # ensure new name does not clash
-        existing = await self.organizations.find_one({"name": normalized_new})
-        if existing:
-            raise ValueError("Organization name already exists")
-
-        old_collection = org.get("collection_name")
-        if not old_collection:
-            raise ValueError("Organization collection missing")
-        new_collection = f"org_{normalized_new}"
-        now = datetime.now()
-
-        # create new collection and migrate documents
-        try:
-            await self.db.create_collection(new_collection)
-        except CollectionInvalid:
-            raise ValueError("Organization collection already exists")
-
-        old_coll = self.db[old_collection]
-        new_coll = self.db[new_collection]
-        try:
-            docs = await old_coll.find({}).to_list(length=None)
-            if docs:
-                await new_coll.insert_many(docs)
-        except Exception:
-            await new_coll.drop()
-            raise
-
-        # drop old collection after successful copy
-        await old_coll.drop()
-
-        # update organization metadata
-        await self.organizations.update_one(
-            {"_id": org["_id"]},
-            {
-                "$set": {
-                    "name": normalized_new,
-                    "display_name": new_name,
-                    "collection_name": new_collection,
-                    "updated_at": now,
-                }
-            },
+        updated = await self._perform_rename(
+            org, normalized_new, new_name, datetime.now(timezone.utc), admin
         )
-
-        updated = await self.get_organization_by_name(new_name)
         return {"organization": updated}
 
     async def create_organization(self, organization_name: str, email: str, password: str) -> Dict[str, Any]:
@@ -230,56 +322,93 @@ class OrganizationService:
         if not normalized:
             raise ValueError("Organization name is empty after normalization")
 
-        # ensure org uniqueness
-        existing = await self.organizations.find_one({"name": normalized})
-        if existing:
-            raise ValueError("Organization name already exists")
-
         collection_name = f"org_{normalized}"
-        now = datetime.now()
+        now = datetime.now(timezone.utc)
+
+        # kick off the password hash now so the CPU work overlaps the
+        # create_collection round trip below; awaited before the inserts
+        hash_task = asyncio.create_task(hash_password(password))
 
         # create org collection upfront; if it somehow exists, fail to avoid collisions
         try:
             await self.db.create_collection(collection_name)
         except CollectionInvalid:
-            # motor raises CollectionInvalid if it already exists
+            # motor raises CollectionInvalid if it already exists; collection
+            # names derive from the org name, so this is almost always a
+            # duplicate org — report it as such unless the collection is a
+            # genuinely stale leftover with no org document behind it
+            hash_task.cancel()
+            if await self.organizations.find_one({"name": normalized}, projection={"_id": 1}):
+                raise ValueError("Organization name already exists")
             raise ValueError("Organization collection already exists")
+        except Exception:
+            # unexpected create_collection failure: don't leave the hash
+            # task dangling
+            hash_task.cancel()
+            raise
+
+        # the hash can still fail after the collection exists (503 under hash
+        # saturation, broken pool); drop the fresh collection before
+        # re-raising so the name isn't permanently poisoned for future creates
+        try:
+            password_hash = await hash_task
+        except BaseException:
+            await self.db[collection_name].drop()
+            raise
+
+        # generate both ids client-side so the org can reference its owner
+        # admin from the start, removing the owner backfill update_one
+        org_id = ObjectId()
+        admin_id = ObjectId()
 
         org_doc = {
+            "_id": org_id,
             "name": normalized,
             "display_name": organization_name,
             "collection_name": collection_name,
-            "owner_admin_id": None,
+            "owner_admin_id": admin_id,
             "status": "active",
             "created_at": now,
             "updated_at": now,
         }
-
-        org_res = await self.organizations.insert_one(org_doc)
-        org_id = org_res.inserted_id
-
         admin_doc = {
+            "_id": admin_id,
             "org_id": org_id,
             "email": email,
-            "password_hash": hash_password(password),
+            "password_hash": password_hash,
             "role": "admin",
             "is_active": True,
             "created_at": now,
             "updated_at": now,
         }
-        admin_res = await self.admins.insert_one(admin_doc)
-        admin_id = admin_res.inserted_id
-
-        # link owner admin back to org
-        await self.organizations.update_one({"_id": org_id}, {"$set": {"owner_admin_id": admin_id}})
-
-        # fetch fresh docs for response
-        org = await self.organizations.find_one({"_id": org_id})
-        admin = await self.admins.find_one({"_id": admin_id})
 
+        # ids are client-generated, so the two inserts are independent and
+        # can overlap on the wire; the unique name index rejects duplicate
+        # orgs atomically, replacing the old pre-flight find_one.
+        # return_exceptions makes gather wait for both inserts to settle, so
+        # the compensating deletes below can't race a still-in-flight insert
+        # and leave an orphaned admin behind
+        results = await asyncio.gather(
+            self.organizations.insert_one(org_doc),
+            self.admins.insert_one(admin_doc),
+            return_exceptions=True,
+        )
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            # one insert failed; clean up whatever landed
+            await asyncio.gather(
+                self.db[collection_name].drop(),
+                self.organizations.delete_one({"_id": org_id}),
+                self.admins.delete_one({"_id": admin_id}),
+            )
+            if any(isinstance(e, DuplicateKeyError) for e in errors):
+                raise ValueError("Organization name already exists")
+            raise errors[0]
+
+        # build the response from the documents already in memory
         return {
-            "organization": serialize_mongo_doc(org) if org else None,
-            "admin": serialize_mongo_doc(admin) if admin else None,
+            "organization": serialize_mongo_doc(org_doc),
+            "admin": serialize_mongo_doc(admin_doc),
         }
 
     async def delete_organization(self, organization_name: str, token: str) -> Dict[str, Any]:
@@ -290,15 +419,15 @@ class OrganizationService:
         if not token:
             raise ValueError("Missing token")
 
-        bearer_prefix = "bearer "
-        token_str = token.strip()
-        if token_str.lower().startswith(bearer_prefix):
-            token_str = token_str[len(bearer_prefix) :].strip()
+        m = _BEARER_RE.match(token)
+        token_str = token[m.end():].strip() if m else token.strip()
 
         try:
-            payload = decode_access_token(token_str)
+            payload = _decode_token_cached(token_str)
         except Exception:
             raise ValueError("Invalid token")
+        if payload.get("exp", 0) <= time.time():
+            raise ValueError("Invalid token")
 
         admin_id = payload.get("sub")
         org_id = payload.get("org")
@@ -311,7 +440,10 @@ class OrganizationService:
         except Exception:
             raise ValueError("Invalid token payload")
 
-        admin = await self.admins.find_one({"_id": admin_obj_id, "is_active": True})
+        admin = await self.admins.find_one(
+            {"_id": admin_obj_id, "is_active": True},
+            projection={"org_id": 1, "is_active": 1},
+        )
         if not admin:
             raise ValueError("Invalid credentials")
         if admin.get("org_id") != org_obj_id:
@@ -321,18 +453,35 @@ class OrganizationService:
         if not normalized:
             raise ValueError("Organization name is required")
 
-        org = await self.organizations.find_one({"name": normalized})
+        org = await self.organizations.find_one(
+            {"name": normalized},
+            projection={"_id": 1, "collection_name": 1, "display_name": 1},
+        )
         if not org:
             raise ValueError("Organization not found")
 
         if org.get("_id") != org_obj_id:
             raise ValueError("Token does not match organization")
 
+        # the three deletes are independent once authorization passed, so run
+        # them concurrently instead of paying three sequential round trips
+        ops = [
+            self.admins.delete_many({"org_id": org_obj_id}),
+            self.organizations.delete_one({"_id": org_obj_id}),
+        ]
         collection_name = org.get("collection_name")
         if collection_name:
-            await self.db[collection_name].drop()
-
-        await self.admins.delete_many({"org_id": org_obj_id})
-        await self.organizations.delete_one({"_id": org_obj_id})
+            ops.insert(0, self.db[collection_name].drop())
+        await asyncio.gather(*ops)
+        await _org_cache_pop(normalized)
+        # the requesting admin no longer exists; drop its cached auth entry so
+        # the token stops working immediately instead of after the cache TTL
+        await invalidate_token_cache(token_str)
 
         return {"deleted": True, "organization_name": org.get("display_name") or organization_name}
+
+
+@lru_cache(maxsize=1)
+def get_org_service() -> OrganizationService:
+    """Process-wide OrganizationService; stateless aside from DB handles."""
+    return OrganizationService()